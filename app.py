@@ -1,13 +1,31 @@
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template, jsonify, request
+from flask.json.provider import JSONProvider
 from datetime import datetime
+import functools
+import gzip
+import orjson
 import os
+import threading
+import time
 from data_fetcher import MacroDataFetcher
 from signals import Signals
 from database import Database
 from notifier import Notifier
 from gemini_analyzer import GeminiAnalyzer
 
+
+class OrjsonProvider(JSONProvider):
+    """Serialize API responses with orjson instead of the stdlib json module"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Initialize components
 db = Database()
@@ -16,6 +34,69 @@ signals = Signals()
 notifier = Notifier()
 analyzer = GeminiAnalyzer()
 
+# Background refresh cadence (seconds); requests only read what it produces
+REFRESH_INTERVAL = 15 * 60
+HISTORY_INTERVAL = 60 * 60
+_refresh_requested = threading.Event()
+# Indicator values of the last row written, so unchanged refreshes are not re-inserted
+_last_saved = None
+
+
+def refresh_macro_data():
+    """Fetch a fresh macro snapshot from FRED and persist it with its regime score"""
+    global _last_saved
+    macro_data = _add_regime_score(dict(fetcher.get_snapshot(max_age=0, force_refresh=True)))
+    values = {k: v for k, v in macro_data.items() if k != 'timestamp'}
+    # Only remember rows that were actually written, so a failed insert is retried
+    if values != _last_saved and db.save_data(macro_data) is not None:
+        _last_saved = values
+    return macro_data
+
+
+def _background_refresh():
+    """
+    Refresh and save the snapshot now and every REFRESH_INTERVAL after,
+    and the history every HISTORY_INTERVAL
+    """
+    last_history = time.monotonic()
+    while True:
+        try:
+            refresh_macro_data()
+            if time.monotonic() - last_history >= HISTORY_INTERVAL:
+                fetcher.fetch_all_historical(force_refresh=True)
+                last_history = time.monotonic()
+        except Exception as e:
+            print(f"Background refresh failed: {e}")
+        _refresh_requested.wait(REFRESH_INTERVAL)
+        _refresh_requested.clear()
+
+
+_background_started = False
+_background_lock = threading.Lock()
+
+
+def start_background_tasks():
+    """
+    Start the refresh loop, whose first pass builds and saves the snapshot,
+    and pre-warm the history cache.
+    Safe to call more than once; only the first call in a process starts threads.
+    """
+    global _background_started
+    with _background_lock:
+        if _background_started:
+            return
+        _background_started = True
+    threading.Thread(target=fetcher.fetch_all_historical, args=(365,), daemon=True).start()
+    threading.Thread(target=_background_refresh, daemon=True).start()
+
+
+@app.before_request
+def _ensure_background_tasks():
+    # Started from the process that serves requests, never at import time, so the
+    # `flask run --debug` reloader parent and a gunicorn --preload master stay idle
+    if not _background_started:
+        start_background_tasks()
+
 @app.route('/')
 def index():
     """Main dashboard page"""
@@ -23,27 +104,48 @@ def index():
 
 @app.route('/api/current-data')
 def get_current_data():
-    """API endpoint to get current macro data"""
-    data = db.get_latest_data() or {}
-    data = _add_regime_score(data)
-    return jsonify(data)
+    """API endpoint to get current macro data (regime score is stored at write time)"""
+    return jsonify(db.get_latest_data() or {})
+
+# Gzipped copy of the last history payload, keyed by its ETag: (etag, bytes)
+_history_gzip = (None, b'')
+
+
+def _gzip_history(payload, etag):
+    """Compress the history payload once per ETag rather than once per request"""
+    global _history_gzip
+    cached_etag, body = _history_gzip
+    if cached_etag != etag:
+        body = gzip.compress(payload, compresslevel=6)
+        _history_gzip = (etag, body)
+    return body
+
 
 @app.route('/api/history')
 def get_history():
     """API endpoint to get 365-day history for all 8 macro series (for sparklines)."""
     days = 365
     try:
-        history = fetcher.fetch_all_historical(days=days)
-        return jsonify(history)
+        payload, etag = fetcher.get_history_json(days=days)
+        if request.accept_encodings.quality('gzip') > 0:
+            response = app.response_class(_gzip_history(payload, etag), mimetype='application/json')
+            response.content_encoding = 'gzip'
+            etag += '-gzip'
+        else:
+            response = app.response_class(payload, mimetype='application/json')
+        response.vary.add('Accept-Encoding')
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = 3600
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/update-data')
 def update_data():
-    """Manually trigger macro data refresh (boxes + charts). Does not run AI."""
+    """Return the latest macro snapshot (boxes + charts) and its signal. Does not run AI."""
     try:
-        macro_data = fetcher.fetch_all_data()
-        db.save_data(macro_data)
+        macro_data = dict(fetcher.get_snapshot(max_age=REFRESH_INTERVAL))
 
         signal = calculate_signal(macro_data)
         if signal:
@@ -67,11 +169,19 @@ def update_data():
         }), 500
 
 
+@app.route('/api/force-refresh', methods=['POST'])
+def force_refresh():
+    """Queue an immediate background refresh from FRED and return without waiting"""
+    _refresh_requested.set()
+    return jsonify({'success': True, 'queued': True}), 202
+
+
 @app.route('/api/generate-ai-summary')
 def generate_ai_summary():
     """Generate AI trading overview from current macro data (on-demand only)."""
     try:
-        macro_data = fetcher.fetch_all_data()
+        # The background loop keeps this fresh, so only a cold start waits on FRED
+        macro_data = fetcher.get_snapshot(max_age=REFRESH_INTERVAL)
         ai_summary = analyzer.generate_trading_summary(macro_data)
         return jsonify({'success': True, 'ai_summary': ai_summary})
     except Exception as e:
@@ -116,24 +226,35 @@ def test_notification():
 def calculate_signal(data):
     """
     Calculate buy/sell signal based on macro data
-    This is a placeholder - you'll define your own rules
+    This is a placeholder - you'll define your own rules in _signal_rule
+    """
+    signal = _signal_rule(data['gdp_growth'], data['inflation'], data['real_rate'])
+    if signal:
+        action, reason = signal
+        return {'action': action, 'reason': reason}
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _signal_rule(gdp_growth, inflation, real_rate):
+    """
+    Trading rule on the raw indicators, memoized since polls between FRED
+    releases repeat the same inputs. Returns an (action, reason) tuple or None.
     """
     # Example simple rule (replace with your logic):
     # Buy if growth > 2% and inflation < 3% and real rate < 1%
     # Sell if growth < 0% or inflation > 4%
     
-    if data['gdp_growth'] > 2 and data['inflation'] < 3 and data['real_rate'] < 1:
-        return {
-            'action': 'BUY',
-            'reason': 'Strong growth, low inflation, low real rates'
-        }
-    elif data['gdp_growth'] < 0 or data['inflation'] > 4:
-        return {
-            'action': 'SELL',
-            'reason': 'Negative growth or high inflation'
-        }
+    if gdp_growth > 2 and inflation < 3 and real_rate < 1:
+        return ('BUY', 'Strong growth, low inflation, low real rates')
+    elif gdp_growth < 0 or inflation > 4:
+        return ('SELL', 'Negative growth or high inflation')
     
     return None
 
 if __name__ == '__main__':
+    # The debug reloader re-runs this file in a child process (WERKZEUG_RUN_MAIN);
+    # only that child serves requests, so the parent skips the warm-up
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_tasks()
     app.run(debug=True, host='0.0.0.0', port=8000)
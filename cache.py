@@ -0,0 +1,92 @@
+import hashlib
+import os
+import tempfile
+import time
+
+import orjson
+
+# Minimum seconds between sweeps for expired entries
+PRUNE_INTERVAL = 3600
+
+
+class FileCache:
+    """JSON file cache with a per-entry TTL, one file per key"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._last_prune = 0.0
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.md5(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, key):
+        """
+        Look up a cached value
+
+        Args:
+            key: Cache key (any string)
+
+        Returns:
+            The stored value, or None if missing, expired or unreadable
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                entry = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if time.time() - entry['timestamp'] > entry['ttl']:
+            self._remove(self._path(key))
+            return None
+        return entry['payload']
+
+    def set(self, key, value, ttl):
+        """
+        Store a JSON-serializable value for ttl seconds
+
+        Writes go through a temp file and an atomic rename so concurrent
+        readers never see a partial entry. Expired entries are swept at most
+        every PRUNE_INTERVAL seconds. Disk errors are ignored; the cache is an
+        optimization only.
+        """
+        now = time.time()
+        entry = {'timestamp': now, 'ttl': ttl, 'payload': value}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(entry))
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"Could not write cache entry: {e}")
+        if now - self._last_prune >= PRUNE_INTERVAL:
+            self._last_prune = now
+            self.prune()
+
+    def prune(self):
+        """Delete expired and unreadable entries"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        now = time.time()
+        for name in names:
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, 'rb') as f:
+                    entry = orjson.loads(f.read())
+                expired = now - entry['timestamp'] > entry['ttl']
+            except OSError:
+                continue
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                expired = True
+            if expired:
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
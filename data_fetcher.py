@@ -1,8 +1,93 @@
+import numpy as np
+import orjson
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+import bisect
+import csv
+import functools
+import hashlib
+import io
 import os
+import threading
 import time
 
+from cache import FileCache
+
+# FRED series update daily at most, so responses are reused for an hour
+CACHE_TTL = 3600
+# On-disk cache lifetime of raw FRED responses, by how often each series is published
+DAY = 24 * 3600
+SERIES_TTL = {
+    'A191RL1Q225SBEA': 7 * DAY,    # quarterly
+    'CPIAUCSL': 7 * DAY,           # monthly
+    'UNRATE': 7 * DAY,             # monthly
+    'FEDFUNDS': 7 * DAY,           # monthly
+    'GACDISA066MSFRBNY': 7 * DAY,  # monthly
+    'DFII10': DAY,                 # daily
+    'T10Y2Y': DAY,                 # daily
+}
+DEFAULT_SERIES_TTL = DAY
+# Public per-series CSV export; works without an API key
+FRED_GRAPH_CSV_URL = 'https://fred.stlouisfed.org/graph/fredgraph.csv'
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'fred')
+# Concurrent FRED requests per batch; the connection pool is sized to match
+MAX_WORKERS = 8
+# Decimal places kept for derived series (FRED publishes at most 3-4)
+SERIES_DECIMALS = 4
+# (connect, read) timeout in seconds for every FRED request
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+def _empty_series():
+    """Series with no observations, in the {dates, values} layout"""
+    return {'dates': [], 'values': np.empty(0, dtype=np.float64)}
+
+
+def _has_data(value):
+    """False for failed or empty fetches, including series without observations"""
+    if isinstance(value, dict) and 'dates' in value:
+        return len(value['dates']) > 0
+    return bool(value)
+
+
+def _yoy_kernel(values, lag=12):
+    """Percent change of each element versus the one `lag` positions earlier (NaN-propagating)"""
+    return (values[lag:] - values[:-lag]) / values[:-lag] * 100.0
+
+
+def ttl_cached(method):
+    """
+    Cache a fetcher method's result per argument tuple for CACHE_TTL seconds.
+    Empty results (failed or missing fetches) are not cached, and
+    force_refresh=True skips the lookup and replaces the entry. Expired
+    entries are dropped whenever a new one is stored, so keys that are never
+    requested again (e.g. a past as_of date) do not accumulate.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        force_refresh = kwargs.get('force_refresh', False)
+        key = (method.__name__, args, tuple(sorted(
+            (k, v) for k, v in kwargs.items() if k != 'force_refresh'
+        )))
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry and not force_refresh and now - entry[0] < CACHE_TTL:
+            return entry[1]
+        value = method(self, *args, **kwargs)
+        if _has_data(value):
+            with self._cache_lock:
+                expired = [k for k, (ts, _) in self._cache.items() if now - ts >= CACHE_TTL]
+                for k in expired:
+                    del self._cache[k]
+                self._cache[key] = (now, value)
+        return value
+    return wrapper
+
+
 class MacroDataFetcher:
     """Fetches macro economic data from FRED and US Treasury APIs"""
     
@@ -10,163 +95,243 @@ class MacroDataFetcher:
         # FRED API key - get yours free at https://fred.stlouisfed.org/docs/api/api_key.html
         self.fred_api_key = os.getenv('FRED_API_KEY', '')
         self.fred_base_url = 'https://api.stlouisfed.org/fred/series/observations'
+        # Shared session so parallel fetches reuse pooled connections to FRED
+        self.session = requests.Session()
+        # Keep a pool per FRED host (API and CSV export) with a kept-alive
+        # connection for every worker; transient errors are retried
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        self.session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=MAX_WORKERS, max_retries=retry))
+        # One long-lived worker pool shared by every batch of FRED requests
+        self.executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self.file_cache = FileCache(CACHE_DIR)
+        # Latest fetch_all_data() result and when it was built: (data, monotonic ts).
+        # Swapped as one tuple so readers never need the rebuild lock
+        self._snapshot = None
+        self._snapshot_lock = threading.Lock()
+        # Serialized fetch_all_historical() result: (days, fetched_at, bytes, etag)
+        self._history_blob = None
         
-    def fetch_fred_data(self, series_id, limit=1):
+    @ttl_cached
+    def fetch_fred_observations(self, series_id, limit=1, force_refresh=False):
         """
-        Fetch data from FRED API
-        
-        Args:
-            series_id: FRED series identifier
-            limit: Number of most recent observations to fetch
-        
-        Returns:
-            Latest value as float
+        Fetch the most recent observations of a FRED series (newest first).
+        Shared by every fetcher so identical (series_id, limit) requests hit
+        FRED only once per cache window. Responses are also kept on disk for
+        SERIES_TTL, so cached reads can lag a new release by up to that long.
+        force_refresh=True bypasses both caches and rewrites them; the app's
+        background refresh and /api/force-refresh always pass it.
         """
         params = {
             'series_id': series_id,
-            'api_key': self.fred_api_key,
             'file_type': 'json',
             'sort_order': 'desc',
             'limit': limit
         }
+        cache_key = series_id + orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()
+        if not force_refresh:
+            cached = self.file_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        response = requests.get(self.fred_base_url, params=params)
+        response = self.session.get(
+            self.fred_base_url, params={**params, 'api_key': self.fred_api_key}, timeout=REQUEST_TIMEOUT
+        )
         response.raise_for_status()
         
-        data = response.json()
-        if data['observations']:
-            latest = data['observations'][0]
+        observations = orjson.loads(response.content)['observations']
+        if observations:
+            self.file_cache.set(cache_key, observations, SERIES_TTL.get(series_id, DEFAULT_SERIES_TTL))
+        return observations
+
+    def fetch_fred_data(self, series_id, limit=1, force_refresh=False):
+        """
+        Fetch data from FRED API
+        
+        Args:
+            series_id: FRED series identifier
+            limit: Number of most recent observations to fetch
+            force_refresh: Bypass the memory and disk caches
+        
+        Returns:
+            Latest value as float
+        """
+        observations = self.fetch_fred_observations(series_id, limit, force_refresh=force_refresh)
+        if observations:
+            latest = observations[0]
             return {
                 'value': float(latest['value']),
                 'date': latest['date']
             }
         return None
 
-    def fetch_fred_series_history(self, series_id, days=365, limit=500):
+    @ttl_cached
+    def fetch_fred_series_history(self, series_id, days=365, limit=500, as_of=None, force_refresh=False):
         """
-        Fetch time series from FRED for the last N days.
+        Fetch time series from FRED for the N days up to as_of (default: today).
         Uses desc + limit then filters to date range (works for all frequencies).
-        Returns list of {date, value} sorted ascending by date (oldest first).
-        Skips observations with missing (.) values.
+        Returns {'dates': [str], 'values': float64 ndarray} sorted ascending by
+        date (oldest first). Skips observations with missing (.) values.
+        Without an API key the public CSV export is used instead.
         """
-        if not self.fred_api_key:
-            return []
-        end = datetime.now()
+        end = as_of or date.today()
         start = end - timedelta(days=days)
-        params = {
-            'series_id': series_id,
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'sort_order': 'desc',
-            'limit': limit,
-        }
         try:
-            response = requests.get(self.fred_base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            out = []
-            for obs in data.get('observations', []):
-                v = obs.get('value')
-                if v is None or v == '.':
-                    continue
-                dt_str = obs.get('date')
-                if not dt_str:
-                    continue
-                if dt_str < start.strftime('%Y-%m-%d') or dt_str > end.strftime('%Y-%m-%d'):
-                    continue
-                try:
-                    out.append({'date': dt_str, 'value': float(v)})
-                except (ValueError, TypeError):
-                    continue
-            out.sort(key=lambda x: x['date'])
-            return out
+            if not self.fred_api_key:
+                return self.fetch_fred_series_csv(series_id, start, end)
+            observations = self.fetch_fred_observations(series_id, limit, force_refresh=force_refresh)
+            start_s = start.strftime('%Y-%m-%d')
+            end_s = end.strftime('%Y-%m-%d')
+            # FRED returns newest first; once ascending, the window is one slice
+            observations = observations[::-1]
+            lo = bisect.bisect_left(observations, start_s, key=lambda o: o['date'])
+            hi = bisect.bisect_right(observations, end_s, key=lambda o: o['date'])
+            observations = [o for o in observations[lo:hi] if o['value'] != '.']
+            return {
+                'dates': [o['date'] for o in observations],
+                'values': np.array([o['value'] for o in observations], dtype=np.float64),
+            }
         except Exception:
-            return []
+            return _empty_series()
 
-    def fetch_inflation_yoy_history(self, days=365):
-        """Fetch CPI and return YoY % change for each month (last 24 months of YoY)."""
-        if not self.fred_api_key:
-            return []
-        # Get last 36 months of CPI (desc), then compute YoY for each month that has 12m prior
+    def fetch_fred_series_csv(self, series_id, start, end, keep_missing=False):
+        """
+        Fetch a series between two dates from FRED's graph CSV export.
+        Returns {'dates': [str], 'values': float64 ndarray} ascending by date.
+        Missing values are skipped, or kept as NaN with keep_missing=True so
+        positions stay one per period.
+        """
         params = {
-            'series_id': 'CPIAUCSL',
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'sort_order': 'desc',
-            'limit': 36,
+            'id': series_id,
+            'cosd': start.strftime('%Y-%m-%d'),
+            'coed': end.strftime('%Y-%m-%d'),
+        }
+        response = self.session.get(FRED_GRAPH_CSV_URL, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        rows = csv.reader(io.StringIO(response.text))
+        next(rows, None)  # header: observation_date,<series_id>
+        rows = [r for r in rows if len(r) == 2 and (keep_missing or r[1] not in ('', '.'))]
+        return {
+            'dates': [r[0] for r in rows],
+            'values': np.array([r[1] if r[1] not in ('', '.') else 'nan' for r in rows], dtype=np.float64),
         }
+
+    @ttl_cached
+    def fetch_inflation_yoy_history(self, days=365, as_of=None, force_refresh=False):
+        """
+        Fetch CPI and return YoY % change for each month (last 24 months of YoY
+        within the N days up to as_of, default today)
+        as {'dates': [str], 'values': float64 ndarray}.
+        Without an API key the public CSV export is used instead.
+        """
+        end = as_of or date.today()
         try:
-            response = requests.get(self.fred_base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            observations = list(data.get('observations', []))
-            # observations are newest first; reverse so oldest first for indexing
-            observations = [o for o in observations if o.get('value') and o.get('value') != '.']
-            observations.sort(key=lambda o: o['date'])
-            out = []
-            for i in range(12, len(observations)):
-                cur = observations[i].get('value')
-                prev = observations[i - 12].get('value')
-                if cur and prev and cur != '.' and prev != '.':
-                    try:
-                        yoy = ((float(cur) - float(prev)) / float(prev)) * 100
-                        out.append({'date': observations[i]['date'], 'value': yoy})
-                    except (ValueError, TypeError):
-                        continue
-            # Keep only last 24 months within the requested window
-            cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-            out = [x for x in out if x['date'] >= cutoff]
-            return out[-24:] if len(out) > 24 else out
+            if self.fred_api_key:
+                # Get last 36 months of CPI, then compute YoY for each month that has 12m prior;
+                # observations are newest first, so reverse to oldest first for indexing
+                observations = self.fetch_fred_observations('CPIAUCSL', 36, force_refresh=force_refresh)[::-1]
+                dates = [o['date'] for o in observations]
+                values = np.fromiter(
+                    (float(o['value']) if o.get('value') not in (None, '.') else np.nan for o in observations),
+                    dtype=np.float64,
+                    count=len(observations),
+                )
+            else:
+                # Without a key, read the same ~36 months from the public CSV export
+                cpi = self.fetch_fred_series_csv('CPIAUCSL', end - timedelta(days=3 * 366), end, keep_missing=True)
+                dates, values = cpi['dates'], cpi['values']
+            yoy = _yoy_kernel(values)
+            # Missing months propagate as NaN; keep the last 24 finite months in the window
+            cutoff = (end - timedelta(days=days)).strftime('%Y-%m-%d')
+            keep = np.isfinite(yoy) & (np.array(dates[12:], dtype='U10') >= cutoff)
+            idx = np.flatnonzero(keep)[-24:]
+            return {'dates': [dates[12 + i] for i in idx], 'values': np.round(yoy[idx], SERIES_DECIMALS)}
         except Exception:
-            return []
+            return _empty_series()
 
-    def fetch_all_historical(self, days=365):
+    def fetch_all_historical(self, days=365, force_refresh=False):
         """
         Fetch last 365 days of history for all 8 dashboard series.
-        Returns dict: metric_key -> list of {date, value} (ascending by date).
+        Returns dict: metric_key -> {'dates': [...], 'values': ndarray} (ascending by date).
+        force_refresh=True bypasses the memory and disk caches.
         """
-        def _fetch(series_id, **kwargs):
-            out = self.fetch_fred_series_history(series_id, days=days, **kwargs)
-            time.sleep(0.15)  # avoid FRED rate limiting
-            return out
-
         neutral = self.estimate_neutral_rate()
-        gdp = _fetch('A191RL1Q225SBEA')
-        inflation = self.fetch_inflation_yoy_history(days)
-        time.sleep(0.15)
-        unemployment = _fetch('UNRATE')
-        manufacturing_index = _fetch('GACDISA066MSFRBNY')
-        real_rate = _fetch('DFII10')
-        yield_spread = _fetch('T10Y2Y')
-        fed_funds = _fetch('FEDFUNDS')
-        fed_stance = [{'date': x['date'], 'value': x['value'] - neutral} for x in fed_funds]
-        return {
-            'gdp_growth': gdp,
-            'inflation': inflation,
-            'unemployment': unemployment,
-            'manufacturing_index': manufacturing_index,
-            'real_rate': real_rate,
-            'yield_spread': yield_spread,
+        # One cutoff date for every series, so the windows line up
+        as_of = date.today()
+        series = {
+            'gdp_growth': 'A191RL1Q225SBEA',
+            'unemployment': 'UNRATE',
+            'manufacturing_index': 'GACDISA066MSFRBNY',
+            'real_rate': 'DFII10',
+            'yield_spread': 'T10Y2Y',
+            'fed_funds': 'FEDFUNDS',
+        }
+        # Requests are I/O-bound, so run them concurrently instead of back to back
+        futures = {
+            key: self.executor.submit(
+                self.fetch_fred_series_history, series_id, days, as_of=as_of, force_refresh=force_refresh
+            )
+            for key, series_id in series.items()
+        }
+        futures['inflation'] = self.executor.submit(
+            self.fetch_inflation_yoy_history, days, as_of=as_of, force_refresh=force_refresh
+        )
+        results = {key: future.result() for key, future in futures.items()}
+
+        fed_funds = results['fed_funds']
+        fed_stance = {
+            'dates': fed_funds['dates'],
+            'values': np.round(fed_funds['values'] - neutral, SERIES_DECIMALS),
+        }
+        history = {
+            'gdp_growth': results['gdp_growth'],
+            'inflation': results['inflation'],
+            'unemployment': results['unemployment'],
+            'manufacturing_index': results['manufacturing_index'],
+            'real_rate': results['real_rate'],
+            'yield_spread': results['yield_spread'],
             'fed_funds': fed_funds,
             'fed_stance': fed_stance,
         }
+        # Keep the serialized payload only when every series came back
+        if all(_has_data(v) for v in history.values()):
+            payload = orjson.dumps(history, option=orjson.OPT_SERIALIZE_NUMPY)
+            etag = hashlib.md5(payload, usedforsecurity=False).hexdigest()
+            self._history_blob = (days, time.monotonic(), payload, etag)
+        return history
+
+    def get_history_json(self, days=365):
+        """
+        Return fetch_all_historical(days) as pre-serialized JSON bytes plus an
+        ETag, reusing the stored payload while it is younger than CACHE_TTL.
+        """
+        blob = self._history_blob
+        if blob and blob[0] == days and time.monotonic() - blob[1] < CACHE_TTL:
+            return blob[2], blob[3]
+        history = self.fetch_all_historical(days)
+        blob = self._history_blob
+        if blob and blob[0] == days:
+            return blob[2], blob[3]
+        payload = orjson.dumps(history, option=orjson.OPT_SERIALIZE_NUMPY)
+        return payload, hashlib.md5(payload, usedforsecurity=False).hexdigest()
     
-    def fetch_gdp_growth(self):
+    def fetch_gdp_growth(self, force_refresh=False):
         """
         Fetch GDP growth rate (year-over-year % change)
         Series: A191RL1Q225SBEA (Real GDP % change)
         """
-        result = self.fetch_fred_data('A191RL1Q225SBEA')
+        result = self.fetch_fred_data('A191RL1Q225SBEA', force_refresh=force_refresh)
         return result['value'] if result else None
     
-    def fetch_inflation(self):
+    def fetch_inflation(self, force_refresh=False):
         """
         Fetch CPI inflation rate (year-over-year % change)
         Series: CPIAUCSL (Consumer Price Index)
         We'll need to calculate YoY change
         """
         # Get last 13 months to calculate year-over-year
-        result = self.fetch_fred_data('CPIAUCSL', limit=13)
+        result = self.fetch_fred_data('CPIAUCSL', limit=13, force_refresh=force_refresh)
         
         if result:
             # For simplicity, return the latest value
@@ -174,24 +339,12 @@ class MacroDataFetcher:
             return result['value']
         return None
     
-    def fetch_inflation_yoy(self):
+    def fetch_inflation_yoy(self, force_refresh=False):
         """
         Fetch year-over-year CPI inflation
-        Series: CPIAUCSL
+        Series: CPIAUCSL (same 13-month request as fetch_inflation, so it is fetched once)
         """
-        params = {
-            'series_id': 'CPIAUCSL',
-            'api_key': self.fred_api_key,
-            'file_type': 'json',
-            'sort_order': 'desc',
-            'limit': 13  # Get 13 months to calculate YoY
-        }
-        
-        response = requests.get(self.fred_base_url, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        observations = data['observations']
+        observations = self.fetch_fred_observations('CPIAUCSL', 13, force_refresh=force_refresh)  # 13 months to calculate YoY
         
         if len(observations) >= 13:
             current = float(observations[0]['value'])
@@ -201,44 +354,44 @@ class MacroDataFetcher:
         
         return None
     
-    def fetch_real_treasury_rate(self):
+    def fetch_real_treasury_rate(self, force_refresh=False):
         """
         Fetch 10-year TIPS (Treasury Inflation-Protected Securities) rate
         Series: DFII10 (Market Yield on U.S. Treasury Securities at 10-Year Constant Maturity, Inflation-Indexed)
         """
-        result = self.fetch_fred_data('DFII10')
+        result = self.fetch_fred_data('DFII10', force_refresh=force_refresh)
         return result['value'] if result else None
     
-    def fetch_unemployment_rate(self):
+    def fetch_unemployment_rate(self, force_refresh=False):
         """
         Fetch unemployment rate
         Series: UNRATE (Unemployment Rate)
         """
-        result = self.fetch_fred_data('UNRATE')
+        result = self.fetch_fred_data('UNRATE', force_refresh=force_refresh)
         return result['value'] if result else None
     
-    def fetch_manufacturing_index(self):
+    def fetch_manufacturing_index(self, force_refresh=False):
         """
         Fetch manufacturing index
         Series: GACDISA066MSFRBNY (New York Fed Empire State Manufacturing Survey: General Business Conditions Index)
         """
-        result = self.fetch_fred_data('GACDISA066MSFRBNY')
+        result = self.fetch_fred_data('GACDISA066MSFRBNY', force_refresh=force_refresh)
         return result['value'] if result else None
     
-    def fetch_yield_spread_2_10(self):
+    def fetch_yield_spread_2_10(self, force_refresh=False):
         """
         Fetch 2Y-10Y Treasury yield spread
         Series: T10Y2Y (10-Year Treasury Constant Maturity Minus 2-Year Treasury Constant Maturity)
         """
-        result = self.fetch_fred_data('T10Y2Y')
+        result = self.fetch_fred_data('T10Y2Y', force_refresh=force_refresh)
         return result['value'] if result else None
     
-    def fetch_fed_funds_rate(self):
+    def fetch_fed_funds_rate(self, force_refresh=False):
         """
         Fetch effective federal funds rate
         Series: FEDFUNDS (Effective Federal Funds Rate)
         """
-        result = self.fetch_fred_data('FEDFUNDS')
+        result = self.fetch_fred_data('FEDFUNDS', force_refresh=force_refresh)
         return result['value'] if result else None
     
     def estimate_neutral_rate(self):
@@ -249,28 +402,52 @@ class MacroDataFetcher:
         # Simplified: neutral real rate (~0.5%) + inflation target (2%)
         return 2.5
     
-    def fetch_all_data(self):
+    def fetch_all_data(self, force_refresh=False):
         """
         Fetch all macro indicators
         
+        Args:
+            force_refresh: Bypass the memory and disk caches and query FRED
+        
         Returns:
             Dictionary with all current macro data
         """
-        fed_funds = self.fetch_fed_funds_rate()
-        neutral = self.estimate_neutral_rate()
-        
-        return {
-            'gdp_growth': self.fetch_gdp_growth(),
-            'inflation': self.fetch_inflation_yoy(),
-            'real_rate': self.fetch_real_treasury_rate(),
-            'unemployment': self.fetch_unemployment_rate(),
-            'manufacturing_index': self.fetch_manufacturing_index(),
-            'yield_spread': self.fetch_yield_spread_2_10(),
-            'fed_funds': fed_funds,
-            'neutral_rate': neutral,
-            'fed_stance': fed_funds - neutral if fed_funds else None,
-            'timestamp': datetime.now().isoformat()
+        fetchers = {
+            'gdp_growth': self.fetch_gdp_growth,
+            'inflation': self.fetch_inflation_yoy,
+            'real_rate': self.fetch_real_treasury_rate,
+            'unemployment': self.fetch_unemployment_rate,
+            'manufacturing_index': self.fetch_manufacturing_index,
+            'yield_spread': self.fetch_yield_spread_2_10,
+            'fed_funds': self.fetch_fed_funds_rate,
         }
+        futures = {key: self.executor.submit(fn, force_refresh=force_refresh) for key, fn in fetchers.items()}
+        data = {key: future.result() for key, future in futures.items()}
+
+        fed_funds = data['fed_funds']
+        neutral = self.estimate_neutral_rate()
+        data['neutral_rate'] = neutral
+        data['fed_stance'] = fed_funds - neutral if fed_funds is not None else None
+        data['timestamp'] = datetime.now().isoformat()
+        return data
+
+    def get_snapshot(self, max_age=300, force_refresh=False):
+        """
+        Return the latest fetch_all_data() result, rebuilding it when older
+        than max_age seconds (max_age=0 always rebuilds). A rebuild still reads
+        FRED through the response caches unless force_refresh=True.
+        A fresh snapshot is returned without waiting on a rebuild in progress.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - snapshot[1] < max_age:
+            return snapshot[0]
+        with self._snapshot_lock:
+            # Another thread may have rebuilt it while this one waited
+            snapshot = self._snapshot
+            if snapshot is None or time.monotonic() - snapshot[1] >= max_age:
+                snapshot = (self.fetch_all_data(force_refresh=force_refresh), time.monotonic())
+                self._snapshot = snapshot
+            return snapshot[0]
         
 # Example usage
 if __name__ == '__main__':
@@ -1,56 +1,115 @@
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+import functools
 import os
+import time
 from datetime import datetime
+from typing import Optional
+
+load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> Optional[Client]:
+    """Build the Supabase client once per process from environment variables"""
+    supabase_url = os.getenv('SUPABASE_URL', '')
+    supabase_key = os.getenv('SUPABASE_KEY', '')
+    
+    if supabase_url and supabase_key:
+        return create_client(supabase_url, supabase_key)
+    print("Warning: Supabase credentials not found. Set SUPABASE_URL and SUPABASE_KEY environment variables.")
+    return None
+
 
 class Database:
     """Handles all database operations with Supabase"""
     
     def __init__(self):
-        # Get Supabase credentials from environment variables
-        load_dotenv()
-        supabase_url = os.getenv('SUPABASE_URL', '')
-        supabase_key = os.getenv('SUPABASE_KEY', '')
-        
-        if supabase_url and supabase_key:
-            self.supabase: Client = create_client(supabase_url, supabase_key)
-        else:
-            self.supabase = None
-            print("Warning: Supabase credentials not found. Set SUPABASE_URL and SUPABASE_KEY environment variables.")
+        # Shared process-wide client; safe to use from concurrent requests
+        self.supabase = _get_client()
+        # Short-lived read cache so bursts of dashboard reloads share one query
+        self._cache = {}
+    
+    def _cached(self, key, ttl, loader):
+        """Return loader()'s result, reusing it for ttl seconds (empty results are not kept)"""
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry['t'] < ttl:
+            return entry['data']
+        data = loader()
+        if data:
+            self._cache[key] = {'t': time.monotonic(), 'data': data}
+        return data
+    
+    def invalidate(self):
+        """Drop cached reads so the next get_* call queries Supabase"""
+        self._cache.clear()
     
     def save_data(self, macro_data):
         """
         Save macro data to Supabase
         
         Args:
-            macro_data: Dictionary containing gdp_growth, inflation, real_rate, timestamp
+            macro_data: Dictionary containing gdp_growth, inflation, real_rate,
+                macro_regime_score, timestamp
         
         Returns:
             Inserted record or None if failed
         """
+        return self.save_data_batch([macro_data])[0]
+    
+    def save_data_batch(self, records):
+        """
+        Save several macro data snapshots with a single insert
+        
+        Args:
+            records: List of macro data dictionaries (see save_data)
+        
+        Returns:
+            List of inserted records, with None for rows that failed
+        """
         if not self.supabase:
             print("Cannot save data: Supabase not initialized")
-            return None
+            return [None] * len(records)
+        
+        now = datetime.now().isoformat()
+        rows = [{
+            'gdp_growth': m.get('gdp_growth'),
+            'inflation': m.get('inflation'),
+            'real_rate': m.get('real_rate'),
+            'macro_regime_score': m.get('macro_regime_score'),
+            'created_at': m.get('timestamp', now)
+        } for m in records]
         
+        saved = self._insert_rows(rows)
+        self.invalidate()
+        return saved
+    
+    def _insert_rows(self, rows):
+        """Insert rows in one request, falling back to one request per row"""
         try:
-            data = {
-                'gdp_growth': macro_data.get('gdp_growth'),
-                'inflation': macro_data.get('inflation'),
-                'real_rate': macro_data.get('real_rate'),
-                'created_at': macro_data.get('timestamp', datetime.now().isoformat())
-            }
-            
-            result = self.supabase.table('macro_data').insert(data).execute()
-            return result.data[0] if result.data else None
-            
+            result = self.supabase.table('macro_data').insert(rows).execute()
+            return result.data if result.data else [None] * len(rows)
         except Exception as e:
             print(f"Error saving to Supabase: {e}")
-            return None
+            if len(rows) == 1:
+                return [None]
+        
+        # The batch is rejected as a whole; retry row by row so one bad record
+        # does not drop the others
+        saved = []
+        for row in rows:
+            try:
+                result = self.supabase.table('macro_data').insert(row).execute()
+                saved.append(result.data[0] if result.data else None)
+            except Exception as e:
+                print(f"Error saving to Supabase: {e}")
+                saved.append(None)
+        return saved
     
     def get_latest_data(self):
         """
-        Retrieve the most recent macro data
+        Retrieve the most recent macro data (cached for 10 seconds)
         
         Returns:
             Dictionary with latest data or None
@@ -63,6 +122,10 @@ class Database:
                 'real_rate': None
             }
         
+        return self._cached('latest', 10, self._query_latest_data)
+    
+    def _query_latest_data(self):
+        """Query Supabase for the newest macro_data row"""
         try:
             result = self.supabase.table('macro_data') \
                 .select('*') \
@@ -80,7 +143,7 @@ class Database:
     
     def get_historical_data(self, limit=30):
         """
-        Retrieve historical macro data
+        Retrieve historical macro data (cached for 30 seconds)
         
         Args:
             limit: Number of records to retrieve
@@ -91,6 +154,10 @@ class Database:
         if not self.supabase:
             return []
         
+        return self._cached(('historical', limit), 30, lambda: self._query_historical_data(limit))
+    
+    def _query_historical_data(self, limit):
+        """Query Supabase for the newest `limit` macro_data rows"""
         try:
             result = self.supabase.table('macro_data') \
                 .select('*') \
@@ -111,9 +178,12 @@ CREATE TABLE macro_data (
     gdp_growth DECIMAL(10, 2),
     inflation DECIMAL(10, 2),
     real_rate DECIMAL(10, 2),
+    macro_regime_score DECIMAL(5, 1),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Existing tables: ALTER TABLE macro_data ADD COLUMN macro_regime_score DECIMAL(5, 1);
+
 -- Create index on created_at for faster queries
 CREATE INDEX idx_macro_data_created_at ON macro_data(created_at DESC);
 """
@@ -1,12 +1,48 @@
+import orjson
 import requests
 import os
 
+from cache import FileCache
+
+# Summaries are reused for an hour while the (rounded) macro inputs are unchanged
+SUMMARY_CACHE_TTL = 3600
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'gemini')
+
+# Static part of the Gemini prompt; filled per call by GeminiAnalyzer._build_prompt
+_PROMPT_TEMPLATE = """You are a quantitative macro analyst. Analyze these economic indicators and provide a concise trading summary (3-4 sentences max).
+
+CURRENT MACRO DATA:
+- GDP Growth: {gdp_growth}% YoY
+- Inflation (CPI): {inflation}% YoY
+- Unemployment: {unemployment}%
+- Manufacturing Index: {manufacturing_index}
+- 10Y Real Rate (TIPS): {real_rate}%
+- 2Y-10Y Yield Spread: {yield_spread}% ({yield_curve})
+- Fed Funds Rate: {fed_funds}%
+- Fed Stance vs Neutral: {fed_stance}% ({fed_stance_desc})
+
+Provide:
+1. Overall economic regime (expansion/slowdown/recession)
+2. Asset class positioning (equities/bonds/commodities - bullish/neutral/bearish)
+3. Key risks to watch
+4. Specific actionable insight
+
+Be direct and actionable. No disclaimers about not being financial advice."""
+_PROMPT_FIELDS = (
+    'gdp_growth', 'inflation', 'unemployment', 'manufacturing_index',
+    'real_rate', 'yield_spread', 'fed_funds', 'fed_stance',
+)
+
+
 class GeminiAnalyzer:
     """Generate AI trading summaries using Gemini API"""
     
     def __init__(self):
         self.api_key = os.getenv('GEMINI_API_KEY', '')
         self.api_url = 'https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent'
+        # Reuse the TLS connection to Gemini across summaries
+        self.session = requests.Session()
+        self.cache = FileCache(CACHE_DIR)
     
     def generate_trading_summary(self, macro_data):
         """
@@ -21,6 +57,11 @@ class GeminiAnalyzer:
         if not self.api_key:
             return "Gemini API key not configured. Set GEMINI_API_KEY in .env file."
         
+        cache_key = self._cache_key(macro_data)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         prompt = self._build_prompt(macro_data)
         
         try:
@@ -36,18 +77,19 @@ class GeminiAnalyzer:
                 }]
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}?key={self.api_key}",
                 headers=headers,
-                json=payload
+                data=orjson.dumps(payload)
             )
             
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if 'candidates' in data and len(data['candidates']) > 0:
-                text = data['candidates'][0]['content']['parts'][0]['text']
-                return text.strip()
+                text = data['candidates'][0]['content']['parts'][0]['text'].strip()
+                self.cache.set(cache_key, text, SUMMARY_CACHE_TTL)
+                return text
             
             return "Unable to generate summary"
             
@@ -55,34 +97,20 @@ class GeminiAnalyzer:
             print(f"Gemini API error: {e}")
             return f"Error generating summary: {str(e)}"
     
+    def _cache_key(self, data):
+        """Stable key for the macro inputs, rounded so float noise still hits the cache"""
+        key_src = {
+            k: round(v, 2) if isinstance(v, float) else v
+            for k, v in data.items() if k != 'timestamp'
+        }
+        return orjson.dumps(key_src, option=orjson.OPT_SORT_KEYS).decode()
+    
     def _build_prompt(self, data):
         """Build the prompt for Gemini"""
-        
-        # Format the data nicely
-        fed_stance_desc = "restrictive" if (data.get('fed_stance') or 0) > 0 else "accommodative"
-        yield_curve = "inverted" if (data.get('yield_spread') or 0) < 0 else "normal"
-        
-        prompt = f"""You are a quantitative macro analyst. Analyze these economic indicators and provide a concise trading summary (3-4 sentences max).
-
-CURRENT MACRO DATA:
-- GDP Growth: {data.get('gdp_growth', 'N/A')}% YoY
-- Inflation (CPI): {data.get('inflation', 'N/A')}% YoY
-- Unemployment: {data.get('unemployment', 'N/A')}%
-- Manufacturing Index: {data.get('manufacturing_index', 'N/A')}
-- 10Y Real Rate (TIPS): {data.get('real_rate', 'N/A')}%
-- 2Y-10Y Yield Spread: {data.get('yield_spread', 'N/A')}% ({yield_curve})
-- Fed Funds Rate: {data.get('fed_funds', 'N/A')}%
-- Fed Stance vs Neutral: {data.get('fed_stance', 'N/A')}% ({fed_stance_desc})
-
-Provide:
-1. Overall economic regime (expansion/slowdown/recession)
-2. Asset class positioning (equities/bonds/commodities - bullish/neutral/bearish)
-3. Key risks to watch
-4. Specific actionable insight
-
-Be direct and actionable. No disclaimers about not being financial advice."""
-
-        return prompt
+        ctx = {key: data.get(key, 'N/A') for key in _PROMPT_FIELDS}
+        ctx['fed_stance_desc'] = "restrictive" if (data.get('fed_stance') or 0) > 0 else "accommodative"
+        ctx['yield_curve'] = "inverted" if (data.get('yield_spread') or 0) < 0 else "normal"
+        return _PROMPT_TEMPLATE.format_map(ctx)
 
 # Example usage
 if __name__ == '__main__':
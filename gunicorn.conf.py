@@ -0,0 +1,10 @@
+"""gunicorn settings, picked up automatically from the working directory"""
+workers = 1
+threads = 16
+timeout = 30
+
+
+def post_fork(server, worker):
+    # Warm the caches as soon as the worker exists instead of on its first request
+    from app import start_background_tasks
+    start_background_tasks()
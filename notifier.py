@@ -8,6 +8,8 @@ class Notifier:
         # Your unique topic name - choose something unique like "macro-tracker-yourname-12345"
         self.ntfy_topic = os.getenv('NTFY_TOPIC')
         self.ntfy_url = f'https://ntfy.sh/{self.ntfy_topic}'
+        # Reuse the TLS connection to ntfy.sh across notifications
+        self.session = requests.Session()
     
     def send_notification(self, title, message, priority='default', tags=None):
         """
@@ -31,7 +33,7 @@ class Notifier:
             if tags:
                 headers['Tags'] = ','.join(tags)
             
-            response = requests.post(
+            response = self.session.post(
                 self.ntfy_url,
                 data=message.encode('utf-8'),
                 headers=headers
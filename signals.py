@@ -1,3 +1,42 @@
+import numpy as np
+
+# Component weights, in order: growth, inflation, employment, manufacturing, curve, fed
+_WEIGHTS = np.array([0.25, 0.20, 0.15, 0.15, 0.15, 0.10])
+
+
+def _regime_scores(gdp_growth, inflation, unemployment, manufacturing_index,
+                   yield_curve_spread, fed_stance):
+    """
+    Regime scores for scalars or equal-length arrays; the single definition
+    behind both Signals.calculate_macro_regime_score and its batch variant
+    """
+    gdp_growth, inflation, unemployment, manufacturing_index, yield_curve_spread, fed_stance = (
+        np.asarray(x, dtype=np.float64) for x in
+        (gdp_growth, inflation, unemployment, manufacturing_index, yield_curve_spread, fed_stance)
+    )
+    # Component scores (0-100 each)
+    scores = np.stack([
+        # 1. Growth score (target: 2-4% is ideal)
+        np.clip(gdp_growth / 6 * 100, 0, 100),
+        # 2. Inflation score (target: closer to 2% is better)
+        np.maximum(0, 100 - np.abs(inflation - 2.0) * 30),
+        # 3. Employment score (target: 3.5-4.5% unemployment is healthy; below is too tight)
+        np.select(
+            [unemployment < 3.5, unemployment <= 4.5],
+            [80.0, 100.0],
+            default=np.maximum(0, 100 - (unemployment - 4.5) * 20),
+        ),
+        # 4. Manufacturing score (above 0 is expansion)
+        np.clip(50 + manufacturing_index * 2, 0, 100),
+        # 5. Yield curve score (positive slope is healthy)
+        np.clip(50 + yield_curve_spread * 0.5, 0, 100),
+        # 6. Fed policy score (closer to neutral is better)
+        np.maximum(0, 100 - np.abs(fed_stance) * 40),
+    ], axis=-1)
+    # Weighted average
+    return np.round(scores @ _WEIGHTS, 1)
+
+
 class Signals:
     """Calculates the signals for the macro data"""
     def __init__(self):
@@ -8,41 +47,26 @@ class Signals:
                                 manufacturing_index, real_rate, 
                                 yield_curve_spread, fed_stance):
         
-        # Component scores (0-100 each)
-        
-        # 1. Growth score (target: 2-4% is ideal)
-        growth_score = min(100, max(0, (gdp_growth / 6) * 100))
-        
-        # 2. Inflation score (target: closer to 2% is better)
-        inflation_distance = abs(inflation - 2.0)
-        inflation_score = max(0, 100 - (inflation_distance * 30))
-        
-        # 3. Employment score (target: 3.5-4.5% unemployment is healthy)
-        if 3.5 <= unemployment <= 4.5:
-            employment_score = 100
-        elif unemployment < 3.5:
-            employment_score = 80  # Too tight, inflation risk
-        else:
-            employment_score = max(0, 100 - ((unemployment - 4.5) * 20))
-        
-        # 4. Manufacturing score (above 0 is expansion)
-        manufacturing_score = min(100, max(0, 50 + (manufacturing_index * 2)))
-        
-        # 5. Yield curve score (positive slope is healthy)
-        curve_score = min(100, max(0, 50 + (yield_curve_spread * 0.5)))
-        
-        # 6. Fed policy score (closer to neutral is better)
-        fed_score = max(0, 100 - (abs(fed_stance) * 40))
-        
-        # Weighted average
-        regime_score = (
-            growth_score * 0.25 +
-            inflation_score * 0.20 +
-            employment_score * 0.15 +
-            manufacturing_score * 0.15 +
-            curve_score * 0.15 +
-            fed_score * 0.10
-        )
-        
-        return round(regime_score, 1)
+        return float(_regime_scores(
+            gdp_growth, inflation, unemployment, manufacturing_index,
+            yield_curve_spread, fed_stance
+        ))
 
+    @staticmethod
+    def calculate_macro_regime_score_batch(data):
+        """
+        Vectorized calculate_macro_regime_score over many observations, e.g.
+        one row per day of a backtest.
+
+        Args:
+            data: DataFrame or dict of equal-length arrays with gdp_growth,
+                inflation, unemployment, manufacturing_index, yield_spread
+                and fed_stance columns
+
+        Returns:
+            ndarray of regime scores rounded to one decimal
+        """
+        return _regime_scores(
+            data['gdp_growth'], data['inflation'], data['unemployment'],
+            data['manufacturing_index'], data['yield_spread'], data['fed_stance'],
+        )
@@ -45,22 +45,23 @@ try:
     from data_fetcher import MacroDataFetcher
     fetcher = MacroDataFetcher()
     
+    # force_refresh skips the response caches so this really reaches FRED
     # Try fetching GDP data
-    gdp = fetcher.fetch_gdp_growth()
+    gdp = fetcher.fetch_gdp_growth(force_refresh=True)
     if gdp:
         print(f"   ✓ GDP Growth: {gdp:.2f}%")
     else:
         print("   ✗ Failed to fetch GDP data")
     
     # Try fetching inflation
-    inflation = fetcher.fetch_inflation_yoy()
+    inflation = fetcher.fetch_inflation_yoy(force_refresh=True)
     if inflation:
         print(f"   ✓ Inflation: {inflation:.2f}%")
     else:
         print("   ✗ Failed to fetch inflation data")
     
     # Try fetching real rate
-    real_rate = fetcher.fetch_real_treasury_rate()
+    real_rate = fetcher.fetch_real_treasury_rate(force_refresh=True)
     if real_rate:
         print(f"   ✓ Real Rate: {real_rate:.2f}%")
     else:
@@ -0,0 +1,9 @@
+"""WSGI entry point for production servers, e.g.
+
+    gunicorn --workers 1 --threads 16 --timeout 30 wsgi:application
+
+Background refresh threads start in the worker, on its first request or from
+the post_fork hook in gunicorn.conf.py. Importing this module starts nothing,
+so --preload is safe: threads started in the master would not survive the fork.
+"""
+from app import app as application